@@ -36,7 +36,6 @@ from invenio_oauthclient.proxies import current_oauthclient
 from invenio_pidstore.proxies import current_pidstore
 from mistune import markdown
 import requests
-from six import string_types
 from sqlalchemy.orm.exc import NoResultFound
 from werkzeug.local import LocalProxy
 from werkzeug.utils import cached_property, import_string
@@ -44,8 +43,7 @@ from werkzeug.utils import cached_property, import_string
 from .errors import RepositoryAccessError
 from .models import ReleaseStatus, Repository
 from .tasks import sync_hooks
-from .utils import get_extra_metadata, iso_utcnow, parse_timestamp, utcnow, \
-    get_citation_metadata
+from .utils import fetch_release_metadata, iso_utcnow, parse_timestamp, utcnow
 
 
 class GitHubAPI(object):
@@ -334,7 +332,7 @@ class GitHubRelease(object):
     def deposit_class(self):
         """Return a class implementing `publish` method."""
         cls = current_app.config['GITHUB_DEPOSIT_CLASS']
-        if isinstance(cls, string_types):
+        if isinstance(cls, str):
             cls = import_string(cls)
         assert isinstance(cls, type)
         return cls
@@ -419,26 +417,25 @@ class GitHubRelease(object):
         )
 
     @cached_property
-    def extra_metadata(self):
-        """Get extra metadata for file in repository."""
-        return get_extra_metadata(
+    def release_metadata(self):
+        """Get extra and citation metadata from files in repository."""
+        return fetch_release_metadata(
             self.gh.api,
             self.repository['owner']['login'],
             self.repository['name'],
             self.release['tag_name'],
+            self.model
         )
 
+    @cached_property
+    def extra_metadata(self):
+        """Get extra metadata for file in repository."""
+        return self.release_metadata[0]
+
     @cached_property
     def citation_metadata(self):
         """Get citation metadata for file in repository."""
-        return get_citation_metadata(
-            self.gh.api,
-            self.repository['owner']['login'],
-            self.repository['name'],
-            self.release['tag_name'],
-            self.model
-        )
-
+        return self.release_metadata[1]
 
     @cached_property
     def files(self):
@@ -65,6 +65,18 @@ GITHUB_REFRESH_TIMEDELTA = timedelta(days=1)
 GITHUB_RELEASE_CLASS = 'invenio_github.api:GitHubRelease'
 """GitHubRelease class to be used for release handling."""
 
+GITHUB_RELEASE_CELERY_QUEUE = None
+"""Celery queue to which release processing tasks are sent.
+
+Release processing is mostly waiting on the GitHub API, so it is recommended
+to route it to a dedicated queue (e.g. ``'github-io'``) consumed by I/O-bound
+workers, in order not to queue it behind CPU-heavy tasks. If ``None``, the
+default Celery routing is used.
+"""
+
+GITHUB_RELEASE_CELERY_PRIORITY = None
+"""Celery priority of release processing tasks (``None`` for the default)."""
+
 GITHUB_METADATA_FILE = '.invenio.json'
 """File with extra metadata stored in GitHub repository."""
 
@@ -27,7 +27,6 @@
 from __future__ import absolute_import, print_function
 
 from flask import current_app
-from six import string_types
 from sqlalchemy import event
 from werkzeug.utils import cached_property, import_string
 
@@ -48,7 +47,7 @@ class InvenioGitHub(object):
     def release_api_class(self):
         """Github Release API class."""
         cls = current_app.config['GITHUB_RELEASE_CLASS']
-        if isinstance(cls, string_types):
+        if isinstance(cls, str):
             cls = import_string(cls)
         assert issubclass(cls, GitHubRelease)
         return cls
@@ -65,7 +64,7 @@ class InvenioGitHub(object):
     def record_serializer(self):
         """Github Release API class."""
         imp = current_app.config['GITHUB_RECORD_SERIALIZER']
-        if isinstance(imp, string_types):
+        if isinstance(imp, str):
             return import_string(imp)
         return imp
 
@@ -37,6 +37,7 @@ from invenio_records.api import Record
 from invenio_records.models import RecordMetadata
 from invenio_webhooks.models import Event
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy_utils.models import Timestamp
 from sqlalchemy_utils.types import ChoiceType, JSONType, UUIDType
@@ -311,31 +312,64 @@ class Release(db.Model, Timestamp):
     @classmethod
     def create(cls, event):
         """Create a new Release model."""
-        # Check if the release has already been received
         release_id = event.payload['release']['id']
-        existing_release = Release.query.filter_by(
-            release_id=release_id,
-        ).first()
-        if existing_release:
-            raise ReleaseAlreadyReceivedError(release=existing_release)
+
+        # On PostgreSQL the duplicate check is done by the INSERT itself,
+        # which also makes it safe against concurrent deliveries.
+        is_postgresql = db.engine.name == 'postgresql'
+
+        # Check if the release has already been received
+        if not is_postgresql:
+            existing_release = Release.query.filter_by(
+                release_id=release_id,
+            ).first()
+            if existing_release:
+                raise ReleaseAlreadyReceivedError(release=existing_release)
 
         # Create the Release
         repo_id = event.payload['repository']['id']
         repo = Repository.get(user_id=event.user_id, github_id=repo_id)
-        if repo.enabled:
-            with db.session.begin_nested():
-                release = cls(
-                    release_id=release_id,
-                    tag=event.payload['release']['tag_name'],
-                    repository=repo,
-                    event=event,
-                    status=ReleaseStatus.RECEIVED,
-                )
-                db.session.add(release)
-            return release
-        else:
+        if not repo.enabled:
             raise RepositoryDisabledError(repo=repo)
 
+        if is_postgresql:
+            values = dict(
+                id=uuid.uuid4(),
+                release_id=release_id,
+                tag=event.payload['release']['tag_name'],
+                repository_id=repo.id,
+                event_id=event.id,
+                record_id=None,
+                errors=None,
+                status=ReleaseStatus.RECEIVED,
+            )
+            table = cls.__table__
+            stmt = postgresql.insert(table).values(
+                **values
+            ).on_conflict_do_nothing(
+                index_elements=['release_id'],
+            ).returning(table.c.created, table.c.updated)
+            inserted = db.session.execute(stmt).first()
+            if inserted is None:
+                raise ReleaseAlreadyReceivedError()
+            # Attach the inserted row to the session without reloading it
+            release = cls(
+                created=inserted.created, updated=inserted.updated, **values)
+            make_transient_to_detached(release)
+            db.session.add(release)
+            return release
+
+        with db.session.begin_nested():
+            release = cls(
+                release_id=release_id,
+                tag=event.payload['release']['tag_name'],
+                repository=repo,
+                event=event,
+                status=ReleaseStatus.RECEIVED,
+            )
+            db.session.add(release)
+        return release
+
     @property
     def record(self):
         """Get Record object."""
@@ -26,6 +26,7 @@ from __future__ import absolute_import
 
 from datetime import datetime
 
+from flask import current_app
 from invenio_db import db
 from invenio_webhooks.models import Receiver
 
@@ -69,19 +70,34 @@ class GitHubReceiver(Receiver):
         )
         if is_release_event:
             try:
-                release = Release.create(event)
+                # Nothing is pending before the release is created, so the
+                # queries issued by ``Release.create`` do not need to flush.
+                with db.session.no_autoflush:
+                    release = Release.create(event)
                 db.session.commit()
-
-                # FIXME: If we want to skip the processing, we should do it
-                # here (eg. We're in the middle of a migration).
-                # if current_app.config['GITHUB_PROCESS_RELEASES']:
-                process_release.delay(
-                    release.release_id,
-                    verify_sender=self.verify_sender
-                )
             except (ReleaseAlreadyReceivedError, RepositoryDisabledError) as e:
                 event.response_code = 409
                 event.response = dict(message=str(e), status=409)
             except RepositoryAccessError as e:
                 event.response = 403
                 event.response = dict(message=str(e), status=403)
+            else:
+                # Sent after the commit above, as before, but outside of the
+                # block whose errors are turned into 409/403 responses.
+                # FIXME: If we want to skip the processing, we should do it
+                # here (eg. We're in the middle of a migration).
+                # if current_app.config['GITHUB_PROCESS_RELEASES']:
+                options = dict(
+                    priority=current_app.config[
+                        'GITHUB_RELEASE_CELERY_PRIORITY'],
+                    # Allows workers to serialize processing per repository
+                    headers=dict(repo_id=repo_id),
+                )
+                queue = current_app.config['GITHUB_RELEASE_CELERY_QUEUE']
+                if queue:
+                    options['queue'] = queue
+                process_release.apply_async(
+                    args=(release.release_id, ),
+                    kwargs=dict(verify_sender=self.verify_sender),
+                    **options
+                )
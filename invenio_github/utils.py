@@ -19,22 +19,26 @@
 
 """Various utility functions."""
 
-import json
-import yaml
-
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from operator import itemgetter
+from functools import lru_cache, partial
 
-import dateutil.parser
 import pytz
 import requests
-import six
 from flask import current_app
-from github3 import repository
+from github3.exceptions import ForbiddenError, NotFoundError, ServerError, \
+    error_for
 from werkzeug.utils import import_string
 
 from .errors import CustomGitHubMetadataError
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
 def utcnow():
     """UTC timestamp (with timezone)."""
     return datetime.now(tz=pytz.utc)
@@ -47,40 +51,52 @@ def iso_utcnow():
 
 def parse_timestamp(x):
     """Parse ISO8601 formatted timestamp."""
-    dt = dateutil.parser.parse(x)
+    try:
+        # Fast path for the RFC3339 timestamps used by GitHub and us.
+        # ``fromisoformat`` only exists on Python 3.7+.
+        dt = datetime.fromisoformat(
+            x[:-1] + '+00:00' if x.endswith('Z') else x)
+    except (AttributeError, ValueError):
+        import dateutil.parser
+        dt = dateutil.parser.parse(x)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=pytz.utc)
     return dt
 
 
-def get_extra_metadata(gh, owner, repo_name, ref):
-    """Get the metadata file."""
+def _load_extra_metadata(content, metadata_file):
+    """Parse the contents of the metadata file.
+
+    :param content: UTF-8 encoded ``bytes`` or ``str`` file contents.
+    """
     try:
-        content = gh.repository(owner, repo_name).file_contents(
-            path=current_app.config['GITHUB_METADATA_FILE'], ref=ref
-        )
-        if not content:
-            # File does not exists in the given ref
-            return {}
-        return json.loads(content.decoded.decode('utf-8'))
+        return json_loads(content)
     except ValueError:
-        raise CustomGitHubMetadataError(
-            file=current_app.config['GITHUB_METADATA_FILE'])
+        raise CustomGitHubMetadataError(file=metadata_file)
 
 
-def get_citation_metadata(gh, owner, repo_name, ref, release):
-    """Get the metadata file."""
+@lru_cache(maxsize=None)
+def _citation_schema(schema_cls):
+    """Get a shared instance of the citation metadata schema."""
+    return schema_cls()
+
+
+def _load_citation_metadata(content, citation_file, release):
+    """Parse and validate the contents of the citation file.
+
+    :param content: UTF-8 encoded ``bytes`` or ``str`` file contents.
+    """
+    import yaml
     try:
-        content = gh.repository(owner, repo_name).file_contents(
-            path=current_app.config['GITHUB_CITATION_FILE'], ref=ref
-        )
-        if not content:
-            # File does not exists in the given ref
-            return {}
-        data = yaml.safe_load(content.decoded.decode('utf-8'))
-        citation_schema = \
-            current_app.config.get('GITHUB_CITATION_METADATA_SCHEMA')
-        data, errors = citation_schema().load(data)
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+
+    citation_schema = \
+        current_app.config.get('GITHUB_CITATION_METADATA_SCHEMA')
+    try:
+        data = yaml.load(content, Loader=SafeLoader)
+        data, errors = _citation_schema(citation_schema).load(data)
         # TODO: Refactor error storage
         for key in errors:
             errors[key] = str(errors[key])
@@ -89,50 +105,222 @@ def get_citation_metadata(gh, owner, repo_name, ref, release):
         elif errors:
             release.errors = {"CITATION.cff": errors}
         return data
+    except (ValueError, yaml.YAMLError):
+        raise CustomGitHubMetadataError(file=citation_file)
+
+
+def get_extra_metadata(gh, owner, repo_name, ref):
+    """Get the metadata file."""
+    metadata_file = current_app.config['GITHUB_METADATA_FILE']
+    try:
+        content = gh.repository(owner, repo_name).file_contents(
+            path=metadata_file, ref=ref
+        )
+    except ValueError:
+        raise CustomGitHubMetadataError(file=metadata_file)
+    if not content:
+        # File does not exists in the given ref
+        return {}
+    return _load_extra_metadata(content.decoded, metadata_file)
+
+
+def get_citation_metadata(gh, owner, repo_name, ref, release):
+    """Get the metadata file."""
+    citation_file = current_app.config['GITHUB_CITATION_FILE']
+    try:
+        content = gh.repository(owner, repo_name).file_contents(
+            path=citation_file, ref=ref
+        )
     except ValueError:
-        raise CustomGitHubMetadataError(
-            file=current_app.config['GITHUB_CITATION_FILE'])
+        raise CustomGitHubMetadataError(file=citation_file)
+    if not content:
+        # File does not exists in the given ref
+        return {}
+    return _load_citation_metadata(content.decoded, citation_file, release)
 
 
+_RELEASE_METADATA_QUERY = """
+query($owner: String!, $name: String!, $metadata: String!,
+      $citation: String!) {
+  repository(owner: $owner, name: $name) {
+    metadata: object(expression: $metadata) {
+      ... on Blob { text isTruncated }
+    }
+    citation: object(expression: $citation) {
+      ... on Blob { text isTruncated }
+    }
+  }
+}
+"""
+
+
+def fetch_release_metadata(gh, owner, repo_name, ref, release):
+    """Get both the metadata and the citation file in a single request.
+
+    Falls back to :func:`get_extra_metadata` and
+    :func:`get_citation_metadata` for files that could not be retrieved
+    through the GitHub GraphQL API.
+
+    :returns: A tuple with the extra metadata and the citation metadata.
+    """
+    metadata_file = current_app.config['GITHUB_METADATA_FILE']
+    citation_file = current_app.config['GITHUB_CITATION_FILE']
+    response = gh._post(gh._build_url('graphql'), data=dict(
+        query=_RELEASE_METADATA_QUERY,
+        variables=dict(
+            owner=owner,
+            name=repo_name,
+            metadata=u'{0}:{1}'.format(ref, metadata_file),
+            citation=u'{0}:{1}'.format(ref, citation_file),
+        ),
+    ))
+    result = response.json() if response.status_code == 200 else {}
+    repository = (result.get('data') or {}).get('repository')
+    if result.get('errors') or repository is None:
+        return (
+            get_extra_metadata(gh, owner, repo_name, ref),
+            get_citation_metadata(gh, owner, repo_name, ref, release),
+        )
+
+    metadata = repository['metadata']
+    if not metadata:
+        # File does not exists in the given ref
+        extra_metadata = {}
+    elif metadata['text'] is None or metadata['isTruncated']:
+        extra_metadata = get_extra_metadata(gh, owner, repo_name, ref)
+    else:
+        extra_metadata = _load_extra_metadata(metadata['text'], metadata_file)
+
+    citation = repository['citation']
+    if not citation:
+        # File does not exists in the given ref
+        citation_metadata = {}
+    elif citation['text'] is None or citation['isTruncated']:
+        citation_metadata = get_citation_metadata(
+            gh, owner, repo_name, ref, release)
+    else:
+        citation_metadata = _load_citation_metadata(
+            citation['text'], citation_file, release)
+
+    return extra_metadata, citation_metadata
+
+
+def _is_rate_limited(error):
+    """Check if a GitHub API error is caused by an exhausted rate limit."""
+    return error.response.headers.get('X-RateLimit-Remaining') == '0'
+
+
+def _call_with_retry(func, attempts=3, backoff=0.5, max_reset_wait=60):
+    """Call a GitHub API function, retrying on transient errors.
+
+    Server errors and network failures are retried with exponential
+    backoff. If the API rate limit is exhausted and resets within
+    ``max_reset_wait`` seconds, the call is retried once the limit resets.
+    Once the attempts are exhausted the last error is raised, so that the
+    calling task can be retried later.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return func()
+        except ForbiddenError as e:
+            if attempt == attempts or not _is_rate_limited(e):
+                raise
+            reset = e.response.headers.get('X-RateLimit-Reset', 0)
+            wait = int(reset) - time.time()
+            if wait > max_reset_wait:
+                raise
+            time.sleep(max(wait, 0) + 1)
+        except (ServerError, requests.ConnectionError, requests.Timeout):
+            if attempt == attempts:
+                raise
+            time.sleep(backoff * 2 ** (attempt - 1))
+
 
 def get_owner(gh, owner):
     """Get owner of repository as a creator."""
     try:
-        u = gh.user(owner)
-        name = u.name or u.login
-        company = u.company or ''
-        return [dict(name=name, affiliation=company)]
-    except Exception:
+        u = _call_with_retry(lambda: gh.user(owner))
+    except ForbiddenError as e:
+        if _is_rate_limited(e):
+            raise
+        return None
+    # Missing users are returned as a falsy ``NullObject``
+    if not u:
+        return None
+    name = u.name or u.login
+    company = u.company or ''
+    return [dict(name=name, affiliation=company)]
+
+
+def _author(data):
+    """Build an author entry from GitHub user data."""
+    return dict(
+        name=(data['name'] if 'name' in data and data['name']
+              else data['login']),
+        affiliation=data.get('company') or '',
+    )
+
+
+def _get_author(session, contributor):
+    """Get the name and affiliation of a contributor.
+
+    :returns: The author entry, or ``None`` if the user no longer exists.
+    :raises github3.exceptions.GitHubError: if the user cannot be fetched.
+    """
+    # Skip the user lookup if the listing already has the profile fields
+    if contributor.get('name'):
+        return _author(contributor)
+
+    def get_user():
+        r = session.get(contributor['url'])
+        if r.status_code != 200:
+            raise error_for(r)
+        return r.json()
+
+    try:
+        return _author(_call_with_retry(get_user))
+    except NotFoundError:
         return None
 
 
-def get_contributors(gh, repo_id):
-    """Get list of contributors to a repository."""
+def _api_session(gh):
+    """Create a pooled HTTP session authenticated like a GitHub client."""
+    session = requests.Session()
+    session.headers.update(gh.session.headers)
+    session.auth = gh.session.auth
+    return session
+
+
+def get_contributors(gh, repo_id, max_workers=8):
+    """Get list of contributors to a repository.
+
+    The details of the contributors are fetched concurrently over a shared
+    connection pool.
+    """
+    def list_contributors():
+        repo = gh.repository_with_id(repo_id)
+        # Missing repositories are returned as a falsy ``NullObject``
+        if not repo:
+            return None, []
+        # GitHub lists contributors by number of contributions, so only the
+        # first page is needed.
+        contributors_iter = repo.contributors(number=30)
+        return contributors_iter, [x.as_dict() for x in contributors_iter]
+
     try:
-        contributors_iter = gh.repository_with_id(repo_id).contributors()
-        contributors = list(contributors_iter)
-        if contributors_iter.last_status == 200:
-
-            def get_author(contributor):
-                r = requests.get(contributor['url'])
-                if r.status_code == 200:
-                    data = r.json()
-                    return dict(
-                        name=(data['name'] if 'name' in data and data['name']
-                              else data['login']),
-                        affiliation=data.get('company') or '',
-                    )
-            # Sort according to number of contributions
-            contributors = sorted(
-                contributors,
-                key=lambda x: x.as_dict()['contributions'],
-                reverse=True)
-            contributors = [get_author(x.as_dict()) for x in contributors[:30]
-                            if x.as_dict()['type'] == 'User']
-            contributors = filter(lambda x: x is not None, contributors)
-            return contributors
-    except Exception:
+        contributors_iter, contributors = _call_with_retry(list_contributors)
+    except ForbiddenError as e:
+        if _is_rate_limited(e):
+            raise
         return None
+    if contributors_iter is None or contributors_iter.last_status != 200:
+        return None
+
+    contributors = [c for c in contributors if c['type'] == 'User']
+    with _api_session(gh) as session, \
+            ThreadPoolExecutor(max_workers) as executor:
+        authors = executor.map(partial(_get_author, session), contributors)
+        return [a for a in authors if a is not None]
 
 
 def obj_or_import_string(value, default=None):
@@ -142,7 +330,7 @@ def obj_or_import_string(value, default=None):
     :params default: Default object to return if the import fails.
     :returns: The imported object.
     """
-    if isinstance(value, six.string_types):
+    if isinstance(value, str):
         return import_string(value)
     elif value:
         return value
@@ -51,11 +51,16 @@ extras_require = {
     'docs': [
         'Sphinx>=1.4.2',
     ],
+    'postgresql': [
+        'invenio-db[postgresql]>=1.0.4',
+    ],
     'tests': tests_require,
 }
 
 extras_require['all'] = []
-for reqs in extras_require.values():
+for name, reqs in extras_require.items():
+    if name == 'postgresql':
+        continue
     extras_require['all'].extend(reqs)
 
 setup_requires = [
@@ -87,7 +92,6 @@ install_requires = [
     'invenio-webhooks>=1.0.0a4',
     'jsonresolver>=0.2.1,<0.3.0',
     'mistune>=0.7.2',
-    'six>=1.12.0',
     'sqlalchemy-utils>=0.33.11,<0.36',
     'uritemplate.py>=0.2.0,<2.0',
     'urllib3<1.25,>=1.21.1',  # from "invenio-search"
@@ -153,6 +157,7 @@ setup(
     },
     extras_require=extras_require,
     install_requires=install_requires,
+    python_requires='>=3.6',
     setup_requires=setup_requires,
     tests_require=tests_require,
     classifiers=[
@@ -163,10 +168,10 @@ setup(
         'Programming Language :: Python',
         'Topic :: Internet :: WWW/HTTP :: Dynamic Content',
         'Topic :: Software Development :: Libraries :: Python Modules',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: Implementation :: CPython',
         'Development Status :: 3 - Alpha',
     ],
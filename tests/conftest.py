@@ -65,7 +65,6 @@ from invenio_search import InvenioSearch
 from invenio_webhooks import InvenioWebhooks
 from invenio_webhooks.views import blueprint as webhooks_blueprint
 from mock import MagicMock, patch
-from six import b
 from sqlalchemy_utils.functions import create_database, database_exists
 
 from invenio_github import InvenioGitHub
@@ -360,7 +359,7 @@ def github_api(app, db, tester_id, remote_token):
                 dict(name='Smith, Sam', affiliation='NASA'),
             ]
         ))
-        return MagicMock(decoded=b(data))
+        return MagicMock(decoded=data.encode('utf-8'))
     repo_2.file_contents = MagicMock(side_effect=mock_metadata_contents)
 
     repo_3 = github3.repos.Repository(fixtures.REPO('auser', 'arepo', 3))
@@ -379,6 +378,24 @@ def github_api(app, db, tester_id, remote_token):
 
     mock_api.repository_with_id.side_effect = mock_repo_with_id
     mock_api.repository.side_effect = mock_repo_by_name
+
+    def mock_graphql(url, data=None):
+        variables = data['variables']
+        repo = mock_repo_by_name(variables['owner'], variables['name'])
+        if repo is None:
+            return MagicMock(status_code=200, json=lambda: dict(
+                data=dict(repository=None)))
+        objects = {}
+        for alias in ('metadata', 'citation'):
+            ref, path = variables[alias].split(':', 1)
+            content = repo.file_contents(path=path, ref=ref)
+            objects[alias] = dict(
+                text=content.decoded.decode('utf-8'),
+                isTruncated=False,
+            ) if content else None
+        return MagicMock(status_code=200, json=lambda: dict(
+            data=dict(repository=objects)))
+    mock_api._post.side_effect = mock_graphql
     mock_api.markdown.side_effect = lambda x: x
     mock_api.session.head.return_value = MagicMock(status_code=200)
     mock_api.session.get.return_value = MagicMock(raw=fixtures.ZIPBALL())
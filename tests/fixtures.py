@@ -23,9 +23,10 @@
 """Define fixtures for tests."""
 
 import json
+from io import BytesIO
+from urllib.parse import urlencode
 
 import httpretty
-from six.moves import urllib_parse
 
 
 def register_github_api():
@@ -145,7 +146,7 @@ def register_oauth_flow():
         return (
             200,
             headers,
-            urllib_parse.urlencode(body)
+            urlencode(body)
         )
 
     httpretty.register_uri(
@@ -352,8 +353,6 @@ def ZIPBALL():
     """Github repository ZIP fixture."""
     from zipfile import ZipFile
 
-    from six import BytesIO
-
     memfile = BytesIO()
     zipfile = ZipFile(memfile, 'w')
     zipfile.writestr('test.txt', 'hello world')
@@ -24,11 +24,46 @@
 
 from __future__ import absolute_import
 
+import os
+
+import pytest
 from flask import url_for
+from invenio_webhooks.models import Event
+
+from invenio_github.errors import ReleaseAlreadyReceivedError
+from invenio_github.models import Release, ReleaseStatus, Repository
 
-from invenio_github.models import Repository
+from . import fixtures
 
 
 def test_repository_unbound(app):
     """Test create_badge method."""
     assert Repository(name='org/repo', github_id=1).latest_release() is None
+
+
+@pytest.mark.skipif(
+    not os.getenv('SQLALCHEMY_DATABASE_URI', '').startswith('postgresql'),
+    reason='INSERT ... ON CONFLICT is only used on PostgreSQL.')
+def test_release_create_postgresql(app, db, tester_id):
+    """Test release creation through INSERT ... ON CONFLICT DO NOTHING."""
+    repo = Repository.enable(tester_id, github_id=1, name='repo-1', hook=1234)
+    event = Event(
+        receiver_id='github',
+        user_id=tester_id,
+        payload=fixtures.PAYLOAD('auser', 'repo-1', 1),
+    )
+    db.session.add(event)
+    db.session.commit()
+
+    release = Release.create(event)
+    assert release in db.session
+    assert release.release_id == 4321
+    assert release.status == ReleaseStatus.RECEIVED
+    assert release.repository == repo
+    assert release.event == event
+    db.session.commit()
+    assert Release.query.filter_by(release_id=4321).one().id == release.id
+
+    with pytest.raises(ReleaseAlreadyReceivedError):
+        Release.create(event)
+    assert Release.query.count() == 1
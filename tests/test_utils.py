@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Invenio is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Invenio. If not, see <http://www.gnu.org/licenses/>.
+#
+# In applying this licence, CERN does not waive the privileges and immunities
+# granted to it by virtue of its status as an Intergovernmental Organization
+# or submit itself to any jurisdiction.
+
+"""Test utility functions."""
+
+from __future__ import absolute_import
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+import pytz
+from github3.exceptions import ForbiddenError, ServerError
+from github3.null import NullObject
+from mock import MagicMock, patch
+
+from invenio_github.errors import CustomGitHubMetadataError
+from invenio_github.utils import fetch_release_metadata, \
+    get_citation_metadata, get_contributors, get_extra_metadata, get_owner, \
+    parse_timestamp
+
+
+def test_parse_timestamp():
+    """Test parsing of ISO8601 timestamps."""
+    expected = datetime(2024, 1, 2, 3, 4, 5, tzinfo=pytz.utc)
+    assert parse_timestamp('2024-01-02T03:04:05Z') == expected
+    assert parse_timestamp('2024-01-02T03:04:05+00:00') == expected
+    assert parse_timestamp('2024-01-02T03:04:05') == expected
+    assert parse_timestamp('2024-01-02T04:04:05+01:00') == expected
+    # Formats only understood by dateutil
+    assert parse_timestamp('Tue, 02 Jan 2024 03:04:05 GMT') == expected
+
+
+def test_get_extra_metadata(app):
+    """Test fetching the metadata file through the REST API."""
+    gh = MagicMock()
+    file_contents = gh.repository.return_value.file_contents
+
+    file_contents.return_value = MagicMock(decoded=b'{"license": "MIT"}')
+    assert get_extra_metadata(gh, 'auser', 'repo', 'v1.0') == \
+        dict(license='MIT')
+    file_contents.assert_called_once_with(path='.invenio.json', ref='v1.0')
+
+    # Missing file
+    file_contents.return_value = NullObject('Contents')
+    assert get_extra_metadata(gh, 'auser', 'repo', 'v1.0') == {}
+
+    # Empty file
+    file_contents.return_value = MagicMock(decoded=b'')
+    with pytest.raises(CustomGitHubMetadataError):
+        get_extra_metadata(gh, 'auser', 'repo', 'v1.0')
+
+
+def test_get_citation_metadata_invalid(app):
+    """Test fetching a citation file that cannot be parsed."""
+    gh = MagicMock()
+    file_contents = gh.repository.return_value.file_contents
+    for decoded in (b'title: caf\xe9\n', b'title: [unclosed\n'):
+        file_contents.return_value = MagicMock(decoded=decoded)
+        with pytest.raises(CustomGitHubMetadataError):
+            get_citation_metadata(gh, 'auser', 'repo', 'v1.0', MagicMock())
+
+
+def graphql_api(status_code=200, result=None):
+    """Mock a GitHub API answering GraphQL queries with a fixed result."""
+    gh = MagicMock()
+    gh._post.return_value = MagicMock(
+        status_code=status_code, json=MagicMock(return_value=result))
+    return gh
+
+
+def graphql_blobs(metadata=None, citation=None):
+    """GraphQL result for the metadata and citation files of a ref."""
+    return dict(data=dict(repository=dict(metadata=metadata,
+                                          citation=citation)))
+
+
+@pytest.mark.parametrize('status_code,result', [
+    (502, None),
+    (200, dict(data=None, errors=[dict(message='Something went wrong.')])),
+    (200, dict(data=dict(repository=None))),
+])
+def test_fetch_release_metadata_fallback(app, status_code, result):
+    """Test falling back to the REST API when GraphQL fails."""
+    gh = graphql_api(status_code, result)
+    release = MagicMock()
+    with patch('invenio_github.utils.get_extra_metadata',
+               return_value=dict(upload_type='dataset')) as extra, \
+            patch('invenio_github.utils.get_citation_metadata',
+                  return_value=dict(title='Citation')) as citation:
+        assert fetch_release_metadata(gh, 'auser', 'repo', 'v1.0', release) \
+            == (dict(upload_type='dataset'), dict(title='Citation'))
+    extra.assert_called_once_with(gh, 'auser', 'repo', 'v1.0')
+    citation.assert_called_once_with(gh, 'auser', 'repo', 'v1.0', release)
+
+
+def test_fetch_release_metadata(app):
+    """Test fetching the metadata files with a single GraphQL query."""
+    gh = graphql_api(result=graphql_blobs(metadata=dict(
+        text=json.dumps(dict(upload_type='dataset')), isTruncated=False)))
+    with patch('invenio_github.utils.get_extra_metadata') as extra, \
+            patch('invenio_github.utils.get_citation_metadata') as citation:
+        assert fetch_release_metadata(
+            gh, 'auser', 'repo', 'v1.0', MagicMock()) \
+            == (dict(upload_type='dataset'), {})
+    assert not extra.called
+    assert not citation.called
+
+    variables = gh._post.call_args[1]['data']['variables']
+    assert variables['metadata'] == 'v1.0:.invenio.json'
+    assert variables['citation'] == 'v1.0:CITATION.cff'
+
+
+def test_fetch_release_metadata_blob_fallback(app):
+    """Test falling back to the REST API for truncated or binary blobs."""
+    release = MagicMock()
+    gh = graphql_api(result=graphql_blobs(
+        metadata=dict(text='{"upload_type": "da', isTruncated=True),
+        citation=dict(text=None, isTruncated=False),
+    ))
+    with patch('invenio_github.utils.get_extra_metadata',
+               return_value=dict(upload_type='dataset')) as extra, \
+            patch('invenio_github.utils.get_citation_metadata',
+                  return_value=dict(title='Citation')) as citation:
+        assert fetch_release_metadata(gh, 'auser', 'repo', 'v1.0', release) \
+            == (dict(upload_type='dataset'), dict(title='Citation'))
+    extra.assert_called_once_with(gh, 'auser', 'repo', 'v1.0')
+    citation.assert_called_once_with(gh, 'auser', 'repo', 'v1.0', release)
+
+
+def test_parse_timestamp_without_fromisoformat():
+    """Test parsing timestamps on Python versions before 3.7."""
+    with patch('invenio_github.utils.datetime') as datetime_mock:
+        del datetime_mock.fromisoformat
+        assert parse_timestamp('2024-01-02T03:04:05Z') == \
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=pytz.utc)
+
+
+def github_response(status_code, data=None, headers=None):
+    """Mock a response of the GitHub API."""
+    return MagicMock(status_code=status_code, headers=headers or {},
+                     json=MagicMock(return_value=data or {}))
+
+
+def rate_limited_response(reset_in):
+    """Mock a response for an exhausted GitHub API rate limit."""
+    return github_response(403, headers={
+        'X-RateLimit-Remaining': '0',
+        'X-RateLimit-Reset': str(int(time.time() + reset_in)),
+    })
+
+
+class ContributorsIterator(list):
+    """Mock of the GitHub iterator over repository contributors."""
+
+    last_status = 200
+
+
+def contributors_api(*logins):
+    """Mock a GitHub API listing the given users as contributors."""
+    gh = MagicMock()
+    gh.session.headers = {}
+    gh.session.auth = None
+    gh.repository_with_id.return_value.contributors.return_value = \
+        ContributorsIterator(
+            MagicMock(as_dict=MagicMock(return_value=dict(
+                login=login, type='User', contributions=1,
+                url='https://api.github.com/users/' + login,
+            )))
+            for login in logins
+        )
+    return gh
+
+
+def test_get_contributors_user_errors():
+    """Test that failing user lookups are retried or raised."""
+    responses = {
+        'https://api.github.com/users/u1': [
+            github_response(502),
+            github_response(200, dict(login='u1', name='User 1')),
+        ],
+        'https://api.github.com/users/u2': [github_response(404)],
+    }
+    with patch('requests.Session.get',
+               side_effect=lambda url: responses[url].pop(0)), \
+            patch('time.sleep') as sleep:
+        assert get_contributors(contributors_api('u1', 'u2'), 1) == \
+            [dict(name='User 1', affiliation='')]
+    assert sleep.called
+
+    # An exhausted rate limit is not silently ignored
+    with patch('requests.Session.get',
+               return_value=rate_limited_response(3600)):
+        with pytest.raises(ForbiddenError):
+            get_contributors(contributors_api('u1'), 1)
+
+
+def test_get_owner():
+    """Test retries and errors when fetching the owner of a repository."""
+    gh = MagicMock()
+    user = MagicMock(login='auser', company='CERN')
+    user.name = 'A User'
+    owner = [dict(name='A User', affiliation='CERN')]
+
+    # Server errors and short rate limit waits are retried
+    gh.user.side_effect = [
+        ServerError(github_response(502)),
+        ForbiddenError(rate_limited_response(10)),
+        user,
+    ]
+    with patch('time.sleep') as sleep:
+        assert get_owner(gh, 'auser') == owner
+    assert sleep.call_count == 2
+
+    # Persisting server errors are raised
+    gh.user.side_effect = ServerError(github_response(502))
+    with patch('time.sleep'):
+        with pytest.raises(ServerError):
+            get_owner(gh, 'auser')
+    assert gh.user.call_count == 6
+
+    # Long rate limit waits are left to the caller
+    gh.user.side_effect = ForbiddenError(rate_limited_response(3600))
+    with patch('time.sleep') as sleep:
+        with pytest.raises(ForbiddenError):
+            get_owner(gh, 'auser')
+    assert not sleep.called
+
+    # Missing users and other permission errors
+    gh.user.side_effect = None
+    gh.user.return_value = NullObject('User')
+    assert get_owner(gh, 'auser') is None
+    gh.user.side_effect = ForbiddenError(github_response(403))
+    assert get_owner(gh, 'auser') is None
+
+
+def test_get_contributors_missing_repository():
+    """Test listing the contributors of a missing repository."""
+    gh = MagicMock()
+    gh.repository_with_id.return_value = NullObject('Repository')
+    assert get_contributors(gh, 1) is None
+
+    gh = contributors_api('u1')
+    repo = gh.repository_with_id.return_value
+    repo.contributors.return_value.last_status = 404
+    assert get_contributors(gh, 1) is None
@@ -26,6 +26,7 @@ from __future__ import absolute_import
 
 import json
 
+import pytest
 from invenio_webhooks.models import Event
 from mock import patch
 
@@ -51,3 +52,34 @@ def test_webhook_post(app, db, tester_id, location, remote_token, github_api):
 
         from invenio_records.models import RecordMetadata
         assert RecordMetadata.query.count() == 2
+
+
+@pytest.mark.parametrize('queue', [None, 'github-io'])
+def test_webhook_release_task_routing(app, db, tester_id, remote_token,
+                                      github_api, monkeypatch, queue):
+    """Test the routing options of the release processing task."""
+    from . import fixtures
+    monkeypatch.setitem(app.config, 'GITHUB_RELEASE_CELERY_QUEUE', queue)
+    monkeypatch.setitem(app.config, 'GITHUB_RELEASE_CELERY_PRIORITY', 5)
+    Repository.enable(tester_id, github_id=3, name='arepo', hook=1234)
+    db.session.commit()
+
+    payload = json.dumps(fixtures.PAYLOAD('auser', 'arepo', 3, 'v1.0'))
+    headers = [('Content-Type', 'application/json')]
+    with patch('invenio_github.receivers.process_release.apply_async') \
+            as apply_async:
+        with app.test_request_context(headers=headers, data=payload):
+            event = Event.create(receiver_id='github', user_id=tester_id)
+            db.session.commit()
+            event.process()
+            db.session.commit()
+
+    apply_async.assert_called_once()
+    options = apply_async.call_args[1]
+    assert options['args'] == (4321, )
+    assert options['priority'] == 5
+    assert options['headers'] == dict(repo_id=3)
+    if queue:
+        assert options['queue'] == queue
+    else:
+        assert 'queue' not in options